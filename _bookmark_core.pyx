@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3, boundscheck=False, wraparound=False
+
+"""
+书签树遍历 / TXT 配对的 Cython 加速版本 (可选)
+编译：cythonize -i _bookmark_core.pyx
+未编译时 bookmark_tool_gui.py 自动回退到纯 Python 实现，两者行为必须保持一致。
+"""
+
+
+cdef object find_node_by_name(dict node, str name):
+    cdef list stack = [node]
+    cdef list children
+    cdef dict n, c
+    cdef Py_ssize_t i
+    while stack:
+        n = stack.pop()
+        if n.get("type") == "folder" and n.get("name") == name:
+            return n
+        children = n.get("children", [])
+        for i in range(len(children) - 1, -1, -1):
+            c = children[i]
+            if c.get("type") == "folder":
+                stack.append(c)
+    return None
+
+
+cdef list collect_urls(dict node, bint recursive):
+    cdef list results = []
+    cdef list stack = [(node.get("children", []), 0)]
+    cdef list children
+    cdef dict child
+    cdef Py_ssize_t i, n
+    cdef object ctype
+    while stack:
+        children, i = stack.pop()
+        n = len(children)
+        while i < n:
+            child = children[i]
+            i += 1
+            ctype = child.get("type")
+            if ctype == "url":
+                results.append((child.get("name", ""), child.get("url", "")))
+            elif ctype == "folder" and recursive:
+                # 记录父级进度后先深入子文件夹，保持先序输出顺序
+                stack.append((children, i))
+                stack.append((child.get("children", []), 0))
+                break
+    return results
+
+
+cpdef object export_scan(dict node, str name, bint recursive):
+    cdef object target = find_node_by_name(node, name)
+    if target is None:
+        return None
+    return collect_urls(target, recursive)
+
+
+cpdef list pair_lines(list lines):
+    cdef list pairs = []
+    cdef Py_ssize_t i = 0
+    cdef Py_ssize_t n = len(lines)
+    cdef str url
+    while i + 1 < n:
+        url = lines[i + 1]
+        if url[:8].lower().startswith(("http://", "https://")):
+            pairs.append((lines[i], url))
+            i += 2
+        else:
+            i += 1
+    return pairs
@@ -14,13 +14,28 @@ import os
 import re
 import sys
 import time
-import uuid
-import glob
+import fnmatch
+import functools
+import shutil
 import logging
+import queue
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
-from threading import Thread
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# 可选加速：orjson 解析/序列化更快，缺失时回退到标准库 json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 可选加速：Cython 编译的遍历核心 (cythonize -i _bookmark_core.pyx)，未编译时使用纯 Python 实现
+try:
+    import _bookmark_core
+except ImportError:
+    _bookmark_core = None
 
 # 引入现代化 UI 库
 import ttkbootstrap as ttk
@@ -44,6 +59,16 @@ APP_TITLE = "全能书签同步助手 Pro"
 APP_SIZE = (900, 700)  # 稍微调高一点高度以容纳新选项
 OUTPUT_DIR = Path.cwd() / "output"
 BACKUP_RETENTION_DAYS = 7
+BACKUP_PATTERN = "*.bak_*"
+LOG_FLUSH_MS = 120  # 日志面板批量刷新间隔
+UI_POLL_MS = 80     # 工作线程消息队列轮询间隔
+
+# 预编译正则 (文件名清洗 / 备份文件匹配)
+_RE_FN_BAD = re.compile(r'[\\/:*?"<>|]+')
+_RE_FN_CTRL = re.compile(r"[\x00-\x1f\x7f]")
+_RE_FN_WS = re.compile(r"\s+")
+_RE_BAK = re.compile(fnmatch.translate(BACKUP_PATTERN))
+_URL_PREFIXES = ("http://", "https://")
 
 
 # =============================================================================
@@ -83,12 +108,25 @@ class FileUtils:
         chromium_us = unix_us + 11644473600 * 1_000_000
         return str(chromium_us)
 
+    @staticmethod
+    def random_guids(count: int) -> List[str]:
+        """一次 os.urandom 批量生成 count 个 UUID4 字符串"""
+        raw = bytearray(os.urandom(16 * count))
+        for i in range(0, len(raw), 16):
+            raw[i + 6] = (raw[i + 6] & 0x0F) | 0x40  # version 4
+            raw[i + 8] = (raw[i + 8] & 0x3F) | 0x80  # RFC 4122 variant
+        h = raw.hex()
+        return [
+            f"{h[j:j + 8]}-{h[j + 8:j + 12]}-{h[j + 12:j + 16]}-{h[j + 16:j + 20]}-{h[j + 20:j + 32]}"
+            for j in range(0, len(h), 32)
+        ]
+
     @staticmethod
     def sanitize_filename(name: str, max_len: int = 120) -> str:
         name = name.strip()
-        name = re.sub(r'[\\/:*?"<>|]+', "_", name)
-        name = re.sub(r"[\x00-\x1f\x7f]", "", name)
-        name = re.sub(r"\s+", " ", name).strip()
+        name = _RE_FN_BAD.sub("_", name)
+        name = _RE_FN_CTRL.sub("", name)
+        name = _RE_FN_WS.sub(" ", name).strip()
         if not name:
             name = "export"
         return name[:max_len].rstrip()
@@ -97,16 +135,39 @@ class FileUtils:
     def read_json(path: Path) -> Dict[str, Any]:
         if not path.exists():
             raise FileNotFoundError(f"Bookmarks 文件未找到：{path}")
+        raw = path.read_bytes()
         try:
-            return json.loads(path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
+            if orjson is not None:
+                return orjson.loads(raw)
+            return json.loads(raw.decode("utf-8"))
+        except (json.JSONDecodeError, UnicodeDecodeError):
             raise ValueError(f"文件损坏，无法解析 JSON：{path}")
 
+    @staticmethod
+    def backup_file(src: Path, dst: Path) -> None:
+        """优先硬链接 (零拷贝)；write_json 通过临时文件 replace 写入，不会改动被链接的原 inode"""
+        try:
+            os.link(src, dst)
+        except OSError:
+            try:
+                shutil.copyfile(src, dst)
+            except shutil.SameFileError:
+                # 同一秒内重试且上次导入未写回时，dst 已是指向当前内容的硬链接，无需再备份
+                pass
+        else:
+            # 硬链接沿用原文件的 mtime，刷新一下，避免被 AutoCleaner 当作过期备份立即清理。
+            # 硬链接与在用的 Bookmarks 共享 inode，这里也会刷新其 mtime；即使随后导入失败该变化也会保留，属可接受的副作用
+            os.utime(dst)
+
     @staticmethod
     def write_json(path: Path, data: Dict[str, Any]) -> None:
         temp_path = path.with_suffix(".tmp")
         try:
-            temp_path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+            if orjson is not None:
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            else:
+                payload = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+            temp_path.write_bytes(payload)
             temp_path.replace(path)
         except Exception as e:
             if temp_path.exists():
@@ -118,70 +179,80 @@ class AutoCleaner:
     """自动清理逻辑"""
     
     @staticmethod
-    def clean_old_backups(target_dir: Path, pattern: str = "*.bak_*", days: int = 7) -> int:
+    def clean_old_backups(target_dir: Path, pattern: str = BACKUP_PATTERN, days: int = 7) -> int:
         if not target_dir.exists():
             return 0
         
         count = 0
         now = time.time()
         retention_sec = days * 86400
-        search_pattern = str(target_dir / pattern)
+        match = (_RE_BAK if pattern == BACKUP_PATTERN else re.compile(fnmatch.translate(pattern))).match
         
-        for file_path in glob.glob(search_pattern):
-            p = Path(file_path)
-            try:
-                mtime = p.stat().st_mtime
-                if now - mtime > retention_sec:
-                    p.unlink()
-                    logger.info(f"清理过期备份: {p.name}")
-                    count += 1
-            except Exception as e:
-                logger.warning(f"无法删除文件 {p}: {e}")
+        # scandir 一次列目录，DirEntry.stat() 在多数平台上复用目录项缓存
+        with os.scandir(target_dir) as it:
+            for entry in it:
+                if not match(entry.name):
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    if now - entry.stat().st_mtime > retention_sec:
+                        os.unlink(entry.path)
+                        logger.info(f"清理过期备份: {entry.name}")
+                        count += 1
+                except Exception as e:
+                    logger.warning(f"无法删除文件 {entry.path}: {e}")
         return count
 
 
+@functools.lru_cache(maxsize=32)
+def _get_bookmarks_path(browser: str, profile: str) -> Path:
+    home = Path.home()
+    browser = browser.lower()
+    
+    if os.name == "nt":
+        local_app_data = os.environ.get("LOCALAPPDATA")
+        if not local_app_data:
+            raise FileNotFoundError("无法获取 LOCALAPPDATA 环境变量")
+        
+        base = Path(local_app_data)
+        if browser == "chrome":
+            return base / "Google" / "Chrome" / "User Data" / profile / "Bookmarks"
+        elif browser == "edge":
+            return base / "Microsoft" / "Edge" / "User Data" / profile / "Bookmarks"
+
+    elif sys.platform == "darwin":
+        app_support = home / "Library" / "Application Support"
+        if browser == "chrome":
+            return app_support / "Google" / "Chrome" / profile / "Bookmarks"
+        elif browser == "edge":
+            return app_support / "Microsoft Edge" / profile / "Bookmarks"
+
+    else:
+        config = home / ".config"
+        candidates = []
+        if browser == "chrome":
+            candidates = ["google-chrome", "chromium"]
+        elif browser == "edge":
+            candidates = ["microsoft-edge", "microsoft-edge-beta", "microsoft-edge-dev"]
+        
+        for folder in candidates:
+            p = config / folder / profile / "Bookmarks"
+            if p.exists():
+                return p
+        if candidates:
+            return config / candidates[0] / profile / "Bookmarks"
+
+    raise ValueError(f"不支持的浏览器类型: {browser}")
+
+
 class PathFinder:
     """路径探测逻辑"""
     
     @staticmethod
     def get_bookmarks_path(browser: str, profile: str) -> Path:
-        home = Path.home()
-        browser = browser.lower()
-        
-        if os.name == "nt":
-            local_app_data = os.environ.get("LOCALAPPDATA")
-            if not local_app_data:
-                raise FileNotFoundError("无法获取 LOCALAPPDATA 环境变量")
-            
-            base = Path(local_app_data)
-            if browser == "chrome":
-                return base / "Google" / "Chrome" / "User Data" / profile / "Bookmarks"
-            elif browser == "edge":
-                return base / "Microsoft" / "Edge" / "User Data" / profile / "Bookmarks"
-
-        elif sys.platform == "darwin":
-            app_support = home / "Library" / "Application Support"
-            if browser == "chrome":
-                return app_support / "Google" / "Chrome" / profile / "Bookmarks"
-            elif browser == "edge":
-                return app_support / "Microsoft Edge" / profile / "Bookmarks"
-
-        else:
-            config = home / ".config"
-            candidates = []
-            if browser == "chrome":
-                candidates = ["google-chrome", "chromium"]
-            elif browser == "edge":
-                candidates = ["microsoft-edge", "microsoft-edge-beta", "microsoft-edge-dev"]
-            
-            for folder in candidates:
-                p = config / folder / profile / "Bookmarks"
-                if p.exists():
-                    return p
-            if candidates:
-                return config / candidates[0] / profile / "Bookmarks"
-
-        raise ValueError(f"不支持的浏览器类型: {browser}")
+        # 结果在进程内稳定，缓存以免每次任务重复 exists() 探测
+        return _get_bookmarks_path(browser, profile)
 
 
 # =============================================================================
@@ -204,24 +275,19 @@ class BookmarkManager:
         if not root_node:
             raise KeyError(f"在 {req.profile} 中找不到根目录 '{req.root}'")
 
-        # 3. 递归查找目标文件夹
-        target_node = self._find_node_by_name(root_node, req.folder_name)
-        if not target_node:
+        # 3. 查找目标文件夹并收集 URL (单次遍历)
+        pairs = self._export_scan(root_node, req.folder_name, req.include_subfolders)
+        if pairs is None:
             raise FileNotFoundError(f"在 {req.browser} 的 {req.root} 下未找到文件夹: '{req.folder_name}'")
-
-        # 4. 收集 URL
-        pairs = self._collect_urls(target_node, req.include_subfolders)
         if not pairs:
             raise ValueError("该文件夹下为空，没有可导出的书签。")
 
-        # 5. 写入 TXT
+        # 4. 写入 TXT
         OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
         file_name = f"{FileUtils.sanitize_filename(req.folder_name)}.txt"
         out_path = OUTPUT_DIR / file_name
         
-        with out_path.open("w", encoding="utf-8") as f:
-            for name, url in pairs:
-                f.write(f"{name}\n{url}\n\n")
+        out_path.write_text("".join(f"{name}\n{url}\n\n" for name, url in pairs), encoding="utf-8")
 
         return str(out_path), len(pairs), str(bm_path)
 
@@ -237,7 +303,7 @@ class BookmarkManager:
         # 备份
         ts = time.strftime("%Y%m%d_%H%M%S")
         backup_path = bm_path.with_name(f"{bm_path.name}.bak_{ts}")
-        backup_path.write_bytes(bm_path.read_bytes())
+        FileUtils.backup_file(bm_path, backup_path)
         
         # 自动清理
         AutoCleaner.clean_old_backups(bm_path.parent, days=BACKUP_RETENTION_DAYS)
@@ -246,95 +312,118 @@ class BookmarkManager:
         if not root_node:
             raise KeyError(f"找不到根目录 '{req.root}'")
 
-        max_id = self._find_max_id(data)
+        max_id, folder_exists = self._scan(data, root_node, req.folder_name)
         next_id = max_id + 1
 
         folder_name = req.folder_name
-        if self._check_folder_exists(root_node, folder_name):
+        if folder_exists:
             folder_name = f"{folder_name}_{ts}"
 
+        # 本次导入的所有节点共用同一时间戳
+        now_us = FileUtils.chromium_time_us()
+        guids = FileUtils.random_guids(len(pairs) + 1)
         new_folder = {
             "children": [],
-            "date_added": FileUtils.chromium_time_us(),
-            "date_modified": FileUtils.chromium_time_us(),
+            "date_added": now_us,
+            "date_modified": now_us,
             "id": str(next_id),
             "name": folder_name,
             "type": "folder",
-            "guid": str(uuid.uuid4()),
+            "guid": guids[0],
         }
         next_id += 1
 
-        for title, url in pairs:
-            new_url_node = {
-                "date_added": FileUtils.chromium_time_us(),
-                "id": str(next_id),
+        ids = map(str, range(next_id, next_id + len(pairs)))
+        new_folder["children"] = [
+            {
+                "date_added": now_us,
+                "id": node_id,
                 "name": title,
                 "type": "url",
                 "url": url,
-                "guid": str(uuid.uuid4()),
+                "guid": guid,
             }
-            new_folder["children"].append(new_url_node)
-            next_id += 1
-        
+            for (title, url), node_id, guid in zip(pairs, ids, guids[1:])
+        ]
+
         root_node.setdefault("children", []).append(new_folder)
         FileUtils.write_json(bm_path, data)
 
         return folder_name, len(pairs), str(bm_path), str(backup_path)
 
     # --- Helpers ---
-    def _find_node_by_name(self, node: Dict, name: str) -> Optional[Dict]:
-        if node.get("type") == "folder" and node.get("name") == name:
-            return node
-        for child in node.get("children", []):
-            if child.get("type") == "folder":
-                res = self._find_node_by_name(child, name)
-                if res: return res
-        return None
-
-    def _collect_urls(self, node: Dict, recursive: bool) -> List[Tuple[str, str]]:
+    def _export_scan(self, node: Dict, name: str, recursive: bool) -> Optional[List[Tuple[str, str]]]:
+        """先序查找同名文件夹，命中后在同一次遍历中切换为收集 URL；未找到返回 None"""
+        if _bookmark_core is not None:
+            return _bookmark_core.export_scan(node, name, recursive)
+        _get = dict.get
+        # 查找阶段：显式栈迭代 DFS，避免深层嵌套触发 RecursionError；逆序入栈以保持原先序遍历顺序
+        stack = [node]
+        while stack:
+            target = stack.pop()
+            if _get(target, "type") == "folder" and _get(target, "name") == name:
+                break
+            stack.extend(c for c in reversed(_get(target, "children", ())) if _get(c, "type") == "folder")
+        else:
+            return None
+
+        # 收集阶段：迭代器栈，遇到子文件夹时先深入，结束后回到父级继续
         results = []
-        for child in node.get("children", []):
-            ctype = child.get("type")
-            if ctype == "url":
-                results.append((child.get("name", ""), child.get("url", "")))
-            elif ctype == "folder" and recursive:
-                results.extend(self._collect_urls(child, True))
+        iters = [iter(_get(target, "children", ()))]
+        while iters:
+            for child in iters[-1]:
+                ctype = _get(child, "type")
+                if ctype == "url":
+                    results.append((_get(child, "name", ""), _get(child, "url", "")))
+                elif ctype == "folder" and recursive:
+                    iters.append(iter(_get(child, "children", ())))
+                    break
+            else:
+                iters.pop()
         return results
 
     def _parse_txt(self, path: Path) -> List[Tuple[str, str]]:
-        lines = [line.strip() for line in path.read_text(encoding="utf-8", errors="ignore").splitlines() if line.strip()]
+        # 整块读入后一次性解码，绕过文本模式的增量解码与换行转换；splitlines 本身可处理 \r\n
+        text = path.read_bytes().decode("utf-8", "ignore")
+        lines = [line for line in map(str.strip, text.splitlines()) if line]
+        if _bookmark_core is not None:
+            return _bookmark_core.pair_lines(lines)
         pairs = []
-        i = 0
-        while i + 1 < len(lines):
-            title = lines[i]
-            url = lines[i+1]
-            if re.match(r"^https?://", url, re.IGNORECASE):
+        # 相邻两行 (标题, URL) 逐对检查；命中后跳过已用作 URL 的那一行，未命中则滑动一行重新对齐
+        consumed = False
+        for title, url in zip(lines, lines[1:]):
+            if consumed:
+                consumed = False
+                continue
+            if url[:8].lower().startswith(_URL_PREFIXES):
                 pairs.append((title, url))
-                i += 2
-            else:
-                i += 1
+                consumed = True
         return pairs
 
-    def _find_max_id(self, node: Any) -> int:
+    def _scan(self, data: Dict[str, Any], root_node: Dict, name: str) -> Tuple[int, bool]:
+        """单次遍历同时求出最大 id，以及 root_node 的直接子级中是否已有同名文件夹"""
+        # id 只存在于 roots 下的节点中，只沿 children 下降，跳过 guid/name/url 等无关字段
+        _get = dict.get
         max_id = 0
-        if isinstance(node, dict):
-            if "id" in node:
-                try: max_id = int(node["id"])
-                except: pass
-            for v in node.values():
-                m = self._find_max_id(v)
-                if m > max_id: max_id = m
-        elif isinstance(node, list):
-            for item in node:
-                m = self._find_max_id(item)
-                if m > max_id: max_id = m
-        return max_id
-
-    def _check_folder_exists(self, root_node: Dict, name: str) -> bool:
-        for ch in root_node.get("children", []):
-            if ch.get("type") == "folder" and ch.get("name") == name:
-                return True
-        return False
+        exists = False
+        stack = [(None, data.get("roots", {}).values())]
+        while stack:
+            parent, nodes = stack.pop()
+            for n in nodes:
+                if not isinstance(n, dict):
+                    continue
+                try:
+                    i = int(n["id"])
+                    if i > max_id:
+                        max_id = i
+                except (KeyError, TypeError, ValueError):
+                    pass
+                if parent is root_node and _get(n, "type") == "folder" and _get(n, "name") == name:
+                    exists = True
+                ch = _get(n, "children")
+                if ch:
+                    stack.append((n, ch))
+        return max_id, exists
 
 
 # =============================================================================
@@ -353,30 +442,50 @@ class LogPanel(ttk.Frame):
         self.scrollbar = ttk.Scrollbar(self, command=self.text_area.yview)
         self.scrollbar.pack(side="right", fill="y")
         self.text_area.configure(yscrollcommand=self.scrollbar.set)
+        self.text_area.tag_config("ERR", foreground="red")
+
+        # 日志先入队，由定时 flush 合并为一次 insert，避免突发日志时频繁重绘
+        self._queue = deque()
+        self._flush_id = self.after(LOG_FLUSH_MS, self._flush)
 
     def append(self, msg: str, level: str = "INFO"):
-        self.text_area.configure(state="normal")
         ts = time.strftime("%H:%M:%S")
         tag = "ERR" if level == "ERROR" else "NRM"
-        
-        full_msg = f"[{ts}] {msg}\n"
-        self.text_area.insert("end", full_msg, tag)
-        if level == "ERROR":
-            self.text_area.tag_config("ERR", foreground="red")
-        
-        self.text_area.see("end")
-        self.text_area.configure(state="disabled")
+        self._queue.append((f"[{ts}] {msg}\n", tag))
         if level == "ERROR":
             logger.error(msg)
         else:
             logger.info(msg)
 
+    def _flush(self):
+        try:
+            if self._queue:
+                chunks = []
+                while self._queue:
+                    chunks.extend(self._queue.popleft())
+                self.text_area.configure(state="normal")
+                self.text_area.insert("end", *chunks)
+                self.text_area.see("end")
+                self.text_area.configure(state="disabled")
+        finally:
+            # 单次刷新出错也要继续调度，否则之后的日志都不会再显示
+            self._flush_id = self.after(LOG_FLUSH_MS, self._flush)
+
+    def stop(self):
+        """取消待执行的定时刷新，窗口销毁前调用"""
+        self.after_cancel(self._flush_id)
+
 
 class MainApp(ttk.Window):
     def __init__(self):
         super().__init__(themename="cosmo", title=APP_TITLE, size=APP_SIZE, resizable=(True, True))
         self.logic = BookmarkManager()
+        # 后台线程池执行耗时任务；Tk 控件只能在主线程更新，工作线程把 UI 消息放入队列由主线程轮询处理
+        self._pool = ThreadPoolExecutor(max_workers=2)
+        self.ui_queue = queue.Queue()
         self._init_ui()
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        self._drain_id = self.after(UI_POLL_MS, self._drain_ui_queue)
 
     def _init_ui(self):
         # Header
@@ -519,19 +628,20 @@ class MainApp(ttk.Window):
 
     def _export_task(self, req: ExportRequest):
         try:
-            self.status_var.set(f"正在从 {req.browser} 导出...")
-            self.log_panel.append(f"导出任务: Browser={req.browser}, Folder='{req.folder_name}'")
+            self._ui_status(f"正在从 {req.browser} 导出...")
+            self._ui_log(f"导出任务: Browser={req.browser}, Folder='{req.folder_name}'")
             
             out_path, count, src = self.logic.export_bookmarks(req)
             
-            self.log_panel.append(f"成功导出 {count} 条链接。")
-            self.log_panel.append(f"源文件: {src}")
-            self.status_var.set("导出成功")
-            self.after(0, lambda: Messagebox.show_info(f"导出完成！\n路径：{out_path}", "成功"))
+            self._ui_log(f"成功导出 {count} 条链接。")
+            self._ui_log(f"源文件: {src}")
+            self._ui_status("导出成功")
+            self._ui_dialog("info", f"导出完成！\n路径：{out_path}", "成功")
         except Exception as e:
-            self.log_panel.append(f"导出中断: {str(e)}", "ERROR")
-            self.status_var.set("出错")
-            self.after(0, lambda: Messagebox.show_error(str(e), "错误"))
+            err = str(e)
+            self._ui_log(f"导出中断: {err}", "ERROR")
+            self._ui_status("出错")
+            self._ui_dialog("error", err, "错误")
 
     def _on_import_click(self):
         txt = self.imp_txt_path.get().strip()
@@ -557,22 +667,59 @@ class MainApp(ttk.Window):
 
     def _import_task(self, req: ImportRequest):
         try:
-            self.status_var.set(f"正在导入到 {req.browser}...")
-            self.log_panel.append(f"导入任务: Browser={req.browser}, Folder='{req.folder_name}'")
+            self._ui_status(f"正在导入到 {req.browser}...")
+            self._ui_log(f"导入任务: Browser={req.browser}, Folder='{req.folder_name}'")
             
             folder, count, bm_path, bak_path = self.logic.import_bookmarks(req)
             
-            self.log_panel.append(f"导入成功 {count} 条。")
-            self.log_panel.append(f"备份文件: {Path(bak_path).name}")
-            self.status_var.set("导入完成")
-            self.after(0, lambda: Messagebox.show_info(f"导入完成！\n已备份至：{bak_path}", "成功"))
+            self._ui_log(f"导入成功 {count} 条。")
+            self._ui_log(f"备份文件: {Path(bak_path).name}")
+            self._ui_status("导入完成")
+            self._ui_dialog("info", f"导入完成！\n已备份至：{bak_path}", "成功")
         except Exception as e:
-            self.log_panel.append(f"导入中断: {str(e)}", "ERROR")
-            self.status_var.set("出错")
-            self.after(0, lambda: Messagebox.show_error(str(e), "错误"))
+            err = str(e)
+            self._ui_log(f"导入中断: {err}", "ERROR")
+            self._ui_status("出错")
+            self._ui_dialog("error", err, "错误")
+
+    # --- Thread helpers ---
+    def _ui_log(self, msg: str, level: str = "INFO"):
+        self.ui_queue.put(("log", msg, level))
+
+    def _ui_status(self, text: str):
+        self.ui_queue.put(("status", text))
+
+    def _ui_dialog(self, kind: str, msg: str, title: str):
+        self.ui_queue.put((kind, msg, title))
+
+    def _drain_ui_queue(self):
+        try:
+            while True:
+                try:
+                    item = self.ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+                kind = item[0]
+                if kind == "log":
+                    self.log_panel.append(item[1], item[2])
+                elif kind == "status":
+                    self.status_var.set(item[1])
+                elif kind == "info":
+                    Messagebox.show_info(item[1], item[2])
+                elif kind == "error":
+                    Messagebox.show_error(item[1], item[2])
+        finally:
+            # 单条回调出错也要继续轮询，否则之后的日志/状态/弹窗都不会再出现
+            self._drain_id = self.after(UI_POLL_MS, self._drain_ui_queue)
 
     def _run_async(self, func, *args):
-        Thread(target=func, args=args, daemon=True).start()
+        self._pool.submit(func, *args)
+
+    def _on_close(self):
+        self.after_cancel(self._drain_id)
+        self.log_panel.stop()
+        self._pool.shutdown(wait=False)
+        self.destroy()
 
 
 if __name__ == "__main__":